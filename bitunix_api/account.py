@@ -10,15 +10,14 @@ class AccountAPI:
         Get information about open positions for a specific symbol.
 
         Args:
-            symbol: The symbol of the trading pair (e.g., "BTCUSDT").
+            symbol: The uppercase symbol of the trading pair (e.g., "BTCUSDT").
 
         Returns:
             Optional[Dict[str, Any]]: Position information if found, None otherwise.
         """
         path = '/api/v1/futures/position/get_pending_positions'
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": symbol}
         
         response = self._http_client.get(path, params=params)
-        if response and isinstance(response, list) and len(response) > 0:
-            return response[0]
-        return None
+        # The API returns a list (empty when there is no open position)
+        return response[0] if response else None
@@ -47,6 +47,11 @@ class Config:
     def uri_prefix(self) -> str:
         """Get URI prefix"""
         return self.config_data.get('http', {}).get('uri_prefix', '')
+
+    @property
+    def timeout(self) -> float:
+        """Get HTTP request timeout in seconds"""
+        return float(self.config_data.get('http', {}).get('timeout', 10))
         
     def get(self, key: str, default: Any = None) -> Any:
         """
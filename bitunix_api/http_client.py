@@ -1,9 +1,12 @@
 import hashlib
+import os
+import threading
 import time
 from typing import Dict, Any, Optional
-import uuid
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from bitunix_api.config import Config
 from bitunix_api.error_codes import ErrorCode
@@ -15,7 +18,7 @@ def get_nonce() -> str:
     Returns:
         str: 32-character random string
     """
-    return str(uuid.uuid4()).replace('-', '')
+    return os.urandom(16).hex()
 
 def get_timestamp() -> str:
     """
@@ -24,7 +27,7 @@ def get_timestamp() -> str:
     Returns:
         str: Millisecond timestamp
     """
-    return str(int(time.time() * 1000))
+    return str(time.time_ns() // 1_000_000)
 
 def generate_signature(
     api_key: str,
@@ -46,11 +49,47 @@ def generate_signature(
     Returns:
         str: Signature
     """
-    digest_input = nonce + timestamp + api_key + query_params + body
-    digest = hashlib.sha256(digest_input.encode('utf-8')).hexdigest()
-    sign_input = digest + secret_key
-    sign = hashlib.sha256(sign_input.encode('utf-8')).hexdigest()
-    return sign
+    return _sign_bytes(
+        api_key=api_key.encode('utf-8'),
+        secret_key=secret_key.encode('utf-8'),
+        nonce=nonce.encode('utf-8'),
+        timestamp=timestamp.encode('utf-8'),
+        query_params=query_params.encode('utf-8'),
+        body=body.encode('utf-8')
+    )
+
+def _sign_bytes(
+    api_key: bytes,
+    secret_key: bytes,
+    nonce: bytes,
+    timestamp: bytes,
+    query_params: bytes = b"",
+    body: bytes = b""
+) -> str:
+    """
+    Bytes-native implementation of generate_signature, so callers holding
+    pre-encoded keys and raw bodies skip the UTF-8 encoding passes
+    Args:
+        api_key: API key (UTF-8 encoded)
+        secret_key: Secret key (UTF-8 encoded)
+        nonce: Random string (UTF-8 encoded)
+        timestamp: Timestamp (UTF-8 encoded)
+        query_params: Sorted query string (UTF-8 encoded, no spaces)
+        body: Raw JSON bytes (no spaces)
+    Returns:
+        str: Signature
+    """
+    # Feed each part into the hash directly instead of building intermediate strings
+    digest_hash = hashlib.sha256(nonce)
+    digest_hash.update(timestamp)
+    digest_hash.update(api_key)
+    digest_hash.update(query_params)
+    digest_hash.update(body)
+    digest = digest_hash.hexdigest()
+
+    sign_hash = hashlib.sha256(digest.encode('utf-8'))
+    sign_hash.update(secret_key)
+    return sign_hash.hexdigest()
 
 def get_auth_headers(
     api_key: str,
@@ -101,6 +140,11 @@ def sort_params(params: Dict[str, str]) -> str:
     """
     if not params:
         return ""
+    
+    # Single parameter (the common case): nothing to sort
+    if len(params) == 1:
+        (k, v), = params.items()
+        return f"{k}{v}"
         
     # Sort by key and concatenate directly
     return ''.join(f"{k}{v}" for k, v in sorted(params.items()))
@@ -116,15 +160,79 @@ class HttpClient:
         self.config = config
         self.api_key = config.api_key
         self.secret_key = config.secret_key
+        # Credentials never change, so they are encoded once for signing
+        self._api_key_b = self.api_key.encode('utf-8')
+        self._secret_key_b = self.secret_key.encode('utf-8')
+        # Per-thread auth headers template, refilled in place for every request
+        self._local = threading.local()
         self.base_url = config.uri_prefix
+        self.timeout = config.timeout
         self.session = requests.Session()
         
+        # Keep a sized pool of persistent connections so consecutive and concurrent
+        # calls reuse the same TCP/TLS connections. Only connect errors are retried:
+        # read, status, redirect and other errors (e.g. TLS failures after the body
+        # was sent) would resend the same nonce, timestamp and sign, so they are disabled.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                other=0,
+                status=0,
+                redirect=0,
+                backoff_factor=0.2,
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        
         # Set common request headers
         self.session.headers.update({
             "language": "en-US",
             "Content-Type": "application/json"
         })
         
+    def _get_auth_headers(self, query_params: bytes = b"", body: bytes = b"") -> Dict[str, str]:
+        """
+        Get authentication headers, signing with the pre-encoded credentials.
+        The returned dict is reused by later requests from the same thread, which
+        is safe because requests copies the headers when preparing each request.
+        
+        Args:
+            query_params: Sorted query string (UTF-8 encoded)
+            body: Raw request body
+            
+        Returns:
+            Dict[str, str]: Authentication headers
+        """
+        nonce = get_nonce()
+        timestamp = get_timestamp()
+        
+        sign = _sign_bytes(
+            api_key=self._api_key_b,
+            secret_key=self._secret_key_b,
+            nonce=nonce.encode('utf-8'),
+            timestamp=timestamp.encode('utf-8'),
+            query_params=query_params,
+            body=body
+        )
+        
+        headers = getattr(self._local, "auth_headers", None)
+        if headers is None:
+            headers = self._local.auth_headers = {
+                "api-key": self.api_key,
+                "sign": "",
+                "nonce": "",
+                "timestamp": ""
+            }
+        headers["sign"] = sign
+        headers["nonce"] = nonce
+        headers["timestamp"] = timestamp
+        return headers
+        
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
         Handle response
@@ -141,7 +249,7 @@ class HttpClient:
         if response.status_code != 200:
             raise Exception(f"HTTP Error: {response.status_code}")
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if data["code"] != 0:
             error = ErrorCode.get_by_code(data["code"])
             if error:
@@ -153,14 +261,15 @@ class HttpClient:
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
         query_string = sort_params(params) if params else ""
-        headers = get_auth_headers(self.api_key, self.secret_key, query_params=query_string)
-        response = self.session.get(url, params=params, headers=headers)
+        headers = self._get_auth_headers(query_params=query_string.encode('utf-8'))
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
         return self._handle_response(response)
 
     def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
         request_data = data if data is not None else {}
-        body = json.dumps(request_data)
-        headers = get_auth_headers(self.api_key, self.secret_key, body=body)
-        response = self.session.post(url, json=request_data, headers=headers)
+        # Serialize once: the exact bytes that are signed are the ones sent.
+        body = orjson.dumps(request_data)
+        headers = self._get_auth_headers(body=body)
+        response = self.session.post(url, data=body, headers=headers, timeout=self.timeout)
         return self._handle_response(response)
@@ -4,21 +4,30 @@ from typing import Dict, Any, Optional
 class MarketAPI:
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
+        # Trading pair info (precision, limits) does not change during a session.
+        self._pair_info_cache: Dict[str, Dict[str, Any]] = {}
 
     def get_single_trading_pair_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a specific futures trading pair, including precision details.
+        Results are cached per symbol, so only the first call hits the API.
+        The returned dict is the cached entry itself and must be treated as read-only.
 
         Args:
-            symbol: The full symbol of the trading pair (e.g., "BTCUSDT").
+            symbol: The full uppercase symbol of the trading pair (e.g., "BTCUSDT").
 
         Returns:
             Optional[Dict[str, Any]]: Trading pair information if found, None otherwise.
         """
+        cached = self._pair_info_cache.get(symbol)
+        if cached is not None:
+            return cached
+
         path = '/api/v1/futures/market/trading_pairs'
-        params = {"symbols": symbol.upper()}
+        params = {"symbols": symbol}
         
         response = self._http_client.get(path, params=params)
-        if response and isinstance(response, list) and len(response) > 0:
-            return response[0] # The API returns a list, even for a single symbol
-        return None
\ No newline at end of file
+        if not response:
+            return None
+        self._pair_info_cache[symbol] = response[0] # The API returns a list, even for a single symbol
+        return response[0]
\ No newline at end of file
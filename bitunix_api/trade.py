@@ -10,13 +10,13 @@ class TradeAPI:
         Get all open orders for a specific symbol.
 
         Args:
-            symbol: The symbol of the trading pair (e.g., "BTCUSDT").
+            symbol: The uppercase symbol of the trading pair (e.g., "BTCUSDT").
 
         Returns:
             List[Dict[str, Any]]: List of open orders.
         """
         path = '/api/v1/futures/trade/get_pending_orders'
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": symbol}
         return self._http_client.get(path, params=params)
 
     def get_symbol_pending_tpsl_orders(self, symbol: str) -> List[Dict[str, Any]]:
@@ -24,13 +24,13 @@ class TradeAPI:
         Get all pending TP/SL orders for a specific symbol.
 
         Args:
-            symbol: The symbol of the trading pair (e.g., "BTCUSDT").
+            symbol: The uppercase symbol of the trading pair (e.g., "BTCUSDT").
 
         Returns:
             List[Dict[str, Any]]: List of pending TP/SL orders.
         """
         path = '/api/v1/futures/tpsl/get_pending_orders'
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": symbol}
         return self._http_client.get(path, params=params)
 
     def cancel_orders(self, symbol: str, order_list: List[Dict[str, str]]) -> Dict[str, Any]:
@@ -56,7 +56,7 @@ class TradeAPI:
         Cancel all open orders, optionally for a specific symbol.
 
         Args:
-            symbol: The symbol of the trading pair (e.g., "BTCUSDT"). If None, cancels all orders for all symbols.
+            symbol: The uppercase symbol of the trading pair (e.g., "BTCUSDT"). If None, cancels all orders for all symbols.
 
         Returns:
             Dict[str, Any]: Cancellation result.
@@ -64,7 +64,7 @@ class TradeAPI:
         path = '/api/v1/futures/trade/cancel_all_orders'
         data = None
         if symbol:
-            data = {'symbol': symbol.upper()}
+            data = {'symbol': symbol}
         return self._http_client.post(path, data)
 
     def place_order(self, symbol: str, side: str, order_type: str, qty: str,
@@ -2,6 +2,7 @@
 # Script for Stop-Loss and Take-Profit automation in Bitunix. 
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from bitunix_api.client import BitunixAPI
 from decimal import Decimal, ROUND_DOWN
 
@@ -15,6 +16,10 @@ except Exception as e:
     print(f"Fatal error initializing configuration or API client: {e}") 
     exit() 
 
+# Worker pool used to run independent API calls (order fetches, SL and TP placements) concurrently,
+# so each update cycle costs roughly one round trip per step instead of the sum of all of them.
+executor = ThreadPoolExecutor(max_workers=4)
+
 # ============================================================================== 
 # GLOBAL STATE VARIABLES 
 # ============================================================================== 
@@ -25,6 +30,20 @@ is_active = False
 tracked_position_value = 0 
 is_tp_active = False 
 tp_percentage = 0.0 
+last_sl_price = None # Last SL price placed on the exchange, already adjusted to precision.
+last_tp_order = None # Last TP LIMIT order placed on the exchange, as (adjusted price, qty).
+idle_cycles = 0 # Consecutive loop iterations without a change in the position value.
+
+# Polling cadence while monitoring: fast right after a change, backing off while the position is idle.
+MIN_POLL_INTERVAL = 0.5 # Seconds
+MAX_POLL_INTERVAL = 5.0 # Seconds
+POLL_INTERVAL_STEP = 0.5 # Seconds added per idle cycle
+
+# Side lookups, used instead of branching on the position side:
+# - OPPOSITE_SIDE: side of the orders that close a position.
+# - PROFIT_DIRECTION: sign of a favorable price move (TP above entry for BUY, below for SELL).
+OPPOSITE_SIDE = {"BUY": "SELL", "SELL": "BUY"}
+PROFIT_DIRECTION = {"BUY": 1.0, "SELL": -1.0}
 
 # ============================================================================== 
 # AUXILIARY FUNCTIONS 
@@ -34,100 +53,112 @@ def adjust_price_to_precision(symbol, price):
     """
     Adjusts a price to the precision required by the exchange for a specific symbol.
     This is CRITICAL to prevent orders from being rejected.
-    1. Fetches instrument information from the API.
-    2. Extracts 'quotePrecision' (e.g., 4) and calculates the 'tickSize' (e.g., 0.0001).
-    3. Uses the Decimal library to round the price DOWN to the nearest multiple of the 'tickSize'.
+    1. Fetches instrument information (cached by the API client after the first call per symbol).
+    2. Extracts 'quotePrecision' (e.g., 4) and builds the quantizer (e.g., 0.0001).
+    3. Uses the Decimal library to round the price DOWN to the nearest multiple of the quantizer.
+    The price is returned as a plain decimal string (e.g., '0.1234'), ready for the API,
+    avoiding a float round trip that could reintroduce precision artifacts.
     """
     try: 
         instrument_info = session.market.get_single_trading_pair_info(symbol=symbol) 
         if not instrument_info: 
             print(f"Could not retrieve instrument info for {symbol}.") 
-            return price 
+            return str(price) 
 
         quote_precision = instrument_info.get('quotePrecision') 
         if quote_precision is None: 
             print(f"'quotePrecision' not found in instrument info for {symbol}.") 
-            return price 
+            return str(price) 
 
-        # Calculate tick_size from quote_precision (e.g., 4 -> 0.0001)
-        tick_size = 10 ** -int(quote_precision)
+        # Build the quantizer from quote_precision (e.g., 4 -> 0.0001)
+        quantizer = Decimal(1).scaleb(-int(quote_precision))
 
-        price_decimal = Decimal(str(price)) 
-        tick_size_decimal = Decimal(str(tick_size)) 
-        
-        adjusted_price = (price_decimal / tick_size_decimal).quantize(Decimal('1'), rounding=ROUND_DOWN) * tick_size_decimal 
+        adjusted_price = Decimal(str(price)).quantize(quantizer, rounding=ROUND_DOWN) 
         
-        return float(adjusted_price) 
+        return format(adjusted_price, 'f') 
         
     except Exception as e: 
         print(f"Error adjusting price precision for {symbol}: {e}") 
-        return price 
+        return str(price) 
+
+def compute_sl_tp_prices(entry_price, position_value_usdt, stop_loss_usd, tp_percentage, side):
+    """
+    Calculates the raw (not yet precision-adjusted) stop-loss and take-profit prices in one step.
+    - Stop-loss: the price move that makes the position lose 'stop_loss_usd'.
+    - Take-profit: a 'tp_percentage' move from the entry price in the position's favor.
+    Returns a tuple: (stop_price, take_profit_price)
+    """
+    direction = PROFIT_DIRECTION[side]
+    # stop_loss_usd / position_value_usdt is the fraction of the entry price that equals the max loss.
+    stop_price = entry_price - direction * entry_price * stop_loss_usd / position_value_usdt
+    take_profit_price = entry_price + direction * entry_price * tp_percentage * 0.01
+    return stop_price, take_profit_price
 
 # ============================================================================== 
 # CORE TRADING FUNCTIONS 
 # ============================================================================== 
 
-def cancel_existing_tpsl_orders(symbol): 
+def cancel_existing_orders(symbol, position_side, *, cancel_tpsl, cancel_tp_limit):
     """
-    Finds and cancels all existing TP/SL orders for a given symbol.
-    This is crucial to prevent multiple stop-losses and to replace old ones.
-    It works by first fetching all pending TP/SL orders and then canceling them by ID.
+    Finds and cancels the orders that are about to be replaced, using a single cancel request:
+    - All pending TP/SL orders for the symbol, to prevent multiple stop-losses.
+    - All open LIMIT orders opposite to the position's side, to clear previous Take Profit orders.
+    Both order lists are fetched concurrently, then canceled together by ID.
+    A failed fetch only skips its own orders: whatever was collected is still canceled.
     """
-    try: 
-        pending_orders = session.trade.get_symbol_pending_tpsl_orders(symbol=symbol) 
-        
-        if pending_orders: 
-            orders_to_cancel = [{'orderId': order['id']} for order in pending_orders] 
-            print(f"Found {len(orders_to_cancel)} pending TP/SL order(s). Canceling them now...") 
-            session.trade.cancel_orders(symbol=symbol, order_list=orders_to_cancel) 
-        else: 
-            print("No pending TP/SL orders found for this symbol.") 
-            
-    except Exception as e: 
-        print(f"Error while canceling TP/SL orders: {e}") 
+    tpsl_future = executor.submit(session.trade.get_symbol_pending_tpsl_orders, symbol=symbol) if cancel_tpsl else None
+    open_orders_future = executor.submit(session.trade.get_symbol_open_orders, symbol=symbol) if cancel_tp_limit else None
 
-def cancel_existing_tp_limit_orders(symbol, position_side):
-    """
-    Finds and cancels all open LIMIT orders that are opposite to the current position's side.
-    This is used to clear previous Take Profit orders before placing a new one.
-    """
-    try:
-        opposite_side = "SELL" if position_side == "BUY" else "BUY"
-        
-        pending_orders_response = session.trade.get_symbol_open_orders(symbol=symbol)
-        
-        order_list = pending_orders_response.get('orderList', [])
+    orders_to_cancel = []
 
-        if not order_list:
-            return
+    if tpsl_future:
+        try:
+            pending_orders = tpsl_future.result()
+            if pending_orders:
+                print(f"Found {len(pending_orders)} pending TP/SL order(s).")
+                orders_to_cancel.extend({'orderId': order['id']} for order in pending_orders)
+            else:
+                print("No pending TP/SL orders found for this symbol.")
+        except Exception as e:
+            print(f"Error while fetching TP/SL orders: {e}")
+
+    if open_orders_future:
+        try:
+            opposite_side = OPPOSITE_SIDE[position_side]
+            order_list = (open_orders_future.result() or {}).get('orderList', [])
+
+            # Filter for LIMIT orders on the opposite side
+            tp_orders_to_cancel = [
+                {'orderId': order['orderId']}
+                for order in order_list
+                if order.get('orderType') == 'LIMIT' and order.get('side') == opposite_side
+            ]
+
+            if tp_orders_to_cancel:
+                print(f"Found {len(tp_orders_to_cancel)} open LIMIT order(s) on the {opposite_side} side.")
+                orders_to_cancel.extend(tp_orders_to_cancel)
+            else:
+                print("No opposing TP LIMIT orders found.")
+        except Exception as e:
+            print(f"Error while fetching TP limit orders: {e}")
 
-        # Filter for LIMIT orders on the opposite side
-        tp_orders_to_cancel = [
-            {'orderId': order['orderId']} 
-            for order in order_list 
-            if order.get('orderType') == 'LIMIT' and order.get('side') == opposite_side
-        ]
-        
-        if tp_orders_to_cancel:
-            print(f"Found {len(tp_orders_to_cancel)} open LIMIT order(s) on the {opposite_side} side. Canceling them...")
-            session.trade.cancel_orders(symbol=symbol, order_list=tp_orders_to_cancel)
-        else:
-            print("No opposing TP LIMIT orders found.")
-            
-    except Exception as e:
-        print(f"Error while canceling TP limit orders: {e}")
+    if orders_to_cancel:
+        try:
+            print(f"Canceling {len(orders_to_cancel)} order(s) now...")
+            session.trade.cancel_orders(symbol=symbol, order_list=orders_to_cancel)
+        except Exception as e:
+            print(f"Error while canceling existing orders: {e}")
 
 def set_position_sl(symbol, position_id, sl_price): 
     """
     Places a new stop-loss order linked to a specific position.
+    The price must already be adjusted with adjust_price_to_precision.
     """
-    adjusted_sl_price = adjust_price_to_precision(symbol, sl_price) 
-    
     # Prepare parameters for the API call 
     api_params = { 
         "symbol": symbol, 
         "position_id": str(position_id), 
-        "sl_price": str(adjusted_sl_price) 
+        "sl_price": sl_price 
     } 
     
     try: 
@@ -142,11 +173,10 @@ def set_position_sl(symbol, position_id, sl_price):
 def set_limit_tp_order(symbol, side, position_id, position_qty, tp_price):
     """
     Places a new limit order to act as a take-profit, effectively closing the position.
+    The price must already be adjusted with adjust_price_to_precision.
     """
     # Determine the opposite side for the closing order
-    close_side = "SELL" if side == "BUY" else "BUY"
-    
-    adjusted_tp_price = adjust_price_to_precision(symbol, tp_price)
+    close_side = OPPOSITE_SIDE[side]
         
     try:
         response = session.trade.place_order(
@@ -154,7 +184,7 @@ def set_limit_tp_order(symbol, side, position_id, position_qty, tp_price):
             side=close_side,
             order_type="LIMIT",
             qty=str(position_qty),
-            price=str(adjusted_tp_price),
+            price=tp_price,
             trade_side="CLOSE",
             position_id=str(position_id)
         )
@@ -178,11 +208,12 @@ def get_user_settings():
         Returns (None, 0, False, 0.0) if the user provides invalid input.
     """
     try:
-        tick = input(">> Enter the Ticker to operate (e.g., BTC): ").upper()
+        tick = input(">> Enter the Ticker to operate (e.g., BTC): ").strip().upper()
         if not tick:
             print("Invalid input. Ticker cannot be empty.")
             return None, 0, False, 0.0
 
+        # Normalized once here: the API wrappers expect an uppercase symbol.
         symbol = tick + 'USDT'
         
         sl_input = float(input(f">> Enter the max loss in USDT for {symbol}: "))
@@ -223,7 +254,7 @@ def reset_bot_state():
     Resets all global state variables to their default initial values.
     This is used to ensure a clean state after a position is closed or an error occurs.
     """
-    global is_active, symbol, stop_loss_usd, tracked_position_value, is_tp_active, tp_percentage
+    global is_active, symbol, stop_loss_usd, tracked_position_value, is_tp_active, tp_percentage, last_sl_price, last_tp_order, idle_cycles
     
     print("Returning to inactive mode.")
     is_active = False
@@ -231,13 +262,16 @@ def reset_bot_state():
     symbol = ''
     is_tp_active = False
     tp_percentage = 0.0
+    last_sl_price = None
+    last_tp_order = None
+    idle_cycles = 0
 
 # ==============================================================================
 # MAIN BOT LOOP
 # ==============================================================================
 
 def main(): 
-    global is_active, symbol, stop_loss_usd, tracked_position_value, is_tp_active, tp_percentage
+    global is_active, symbol, stop_loss_usd, tracked_position_value, is_tp_active, tp_percentage, last_sl_price, last_tp_order, idle_cycles
 
     while True: 
         try: 
@@ -260,28 +294,47 @@ def main():
                     if position_value_usdt != tracked_position_value:
                         print("Position value has changed! Updating orders...")
                         
-                        # 4. Calculate the stop-loss trigger price.
-                        percentage = (stop_loss_usd * 100) / position_value_usdt
-                        price_variation = entry_price * (percentage / 100)
-                        stop_price = entry_price - price_variation if side == 'BUY' else entry_price + price_variation
+                        # 4. Calculate the stop-loss trigger price (and the Take Profit price, used if enabled).
+                        stop_price, take_profit_price = compute_sl_tp_prices(entry_price, position_value_usdt, stop_loss_usd, tp_percentage, side)
 
                         # 5. Validate the calculated stop price.
-                        if stop_price <= 0:
+                        place_sl = stop_price > 0
+                        if not place_sl:
                             print("WARNING: Calculated stop-loss price is zero or negative. Order will not be placed.")
                         else:
-                            cancel_existing_tpsl_orders(symbol)
-                            set_position_sl(symbol, position_id, stop_price)
-
-                        # 6. Calculate Take Profit price if enabled
-                        if is_tp_active:
-                            # First, cancel any existing opposing limit orders to prevent conflicts.
-                            cancel_existing_tp_limit_orders(symbol, side)
-                            
-                            tp_price_variation = entry_price * (tp_percentage / 100)
-                            take_profit_price = entry_price + tp_price_variation if side == 'BUY' else entry_price - tp_price_variation
-                            set_limit_tp_order(symbol, side, position_id, position_qty, take_profit_price)
+                            stop_price = adjust_price_to_precision(symbol, stop_price)
+                            # Skip the replacement if the order on the exchange would not change.
+                            if stop_price == last_sl_price:
+                                print("Stop-loss price unchanged after precision adjustment. Keeping current SL order.")
+                                place_sl = False
+
+                        # 6. Adjust the Take Profit price if enabled
+                        place_tp = is_tp_active
+                        if place_tp:
+                            take_profit_price = adjust_price_to_precision(symbol, take_profit_price)
+                            # The TP LIMIT order also carries the position size, so both must match.
+                            if (take_profit_price, position_qty) == last_tp_order:
+                                print("Take-profit order unchanged after precision adjustment. Keeping current TP order.")
+                                place_tp = False
+
+                        # First, cancel the orders being replaced in one round trip to prevent conflicts.
+                        if place_sl or place_tp:
+                            cancel_existing_orders(symbol, side, cancel_tpsl=place_sl, cancel_tp_limit=place_tp)
+
+                        # The new SL and TP orders are independent, so they are placed concurrently.
+                        sl_placement = executor.submit(set_position_sl, symbol, position_id, stop_price) if place_sl else None
+                        tp_placement = executor.submit(set_limit_tp_order, symbol, side, position_id, position_qty, take_profit_price) if place_tp else None
+
+                        # Wait for both placements and remember what is now on the exchange.
+                        if sl_placement:
+                            last_sl_price = stop_price if sl_placement.result() is not None else None
+                        if tp_placement:
+                            last_tp_order = (take_profit_price, position_qty) if tp_placement.result() is not None else None
                         
                         tracked_position_value = position_value_usdt
+                        idle_cycles = 0
+                    else:
+                        idle_cycles += 1
                     
                 else: 
                     # 7. If no position is found, it means it has been closed. 
@@ -309,6 +362,9 @@ def main():
                         tp_percentage = new_tp_percentage
                         is_active = True
                         tracked_position_value = 0 # Reset to force the first SL placement.
+                        last_sl_price = None
+                        last_tp_order = None
+                        idle_cycles = 0
                     else:
                         print(f"No open position found for {new_symbol}. Please open a position to start monitoring.")
 
@@ -324,7 +380,9 @@ def main():
         # ------------------------------------------------------------------
         # LOOP PAUSE
         # ------------------------------------------------------------------
-        time.sleep(1) # 1-second pause to avoid API rate limits. 
+        # Only needed while monitoring: in inactive mode the loop already blocks on user input.
+        if is_active:
+            time.sleep(min(MAX_POLL_INTERVAL, MIN_POLL_INTERVAL + POLL_INTERVAL_STEP * idle_cycles)) # Adaptive pause to avoid API rate limits.
 
 # ============================================================================== 
 # SCRIPT ENTRY POINT 